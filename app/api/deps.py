@@ -1,13 +1,20 @@
+import hashlib
+import threading
+import time
+from functools import lru_cache
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy import event, inspect as sa_inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 from app.core.database import get_db
 from app.models.user import User
 from app.utils.auth import decode_token
 from typing import Optional, List
 from uuid import UUID
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token", auto_error=False)
+# Plain bearer-header parsing; tokens are issued by /auth/login and /auth/token
+bearer_scheme = HTTPBearer(auto_error=False)
 
 # Verification level hierarchy
 VERIFICATION_LEVELS = {
@@ -17,12 +24,64 @@ VERIFICATION_LEVELS = {
     "landlord_verified": 3
 }
 
-async def get_current_user(
+# token sha256 -> (exp, user column snapshot). TTL stays well under the token lifetime;
+# writes to a User evict its entries (see _evict_flushed_users).
+# The cache is per process: eviction only reaches the worker that did the write, so other
+# workers may keep serving a deleted, deactivated or downgraded user for up to this long.
+USER_CACHE_TTL_SECONDS = 30
+_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+# password_hash stays out of memory; the few handlers that read it load it on access
+_USER_COLUMNS = [attr.key for attr in sa_inspect(User).column_attrs if attr.key != "password_hash"]
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _copy_value(value):
+    # JSON columns (capabilities) are mutable lists — never share them with the cache
+    return list(value) if isinstance(value, list) else value
+
+
+def _user_from_snapshot(db: Session, snapshot: dict) -> User:
+    """Attach a cached user to this request's session without a SELECT."""
+    user = User(**{k: _copy_value(v) for k, v in snapshot.items()})
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def invalidate_cached_user(user_id: UUID) -> None:
+    """Drop every cached token entry for this user. Call after bulk UPDATEs that bypass the ORM."""
+    with _user_cache_lock:
+        for key, (_exp, snapshot) in list(_user_cache.items()):
+            if snapshot["id"] == user_id:
+                _user_cache.pop(key, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _evict_flushed_users(session, flush_context):
+    for obj in (*session.dirty, *session.deleted):
+        if isinstance(obj, User):
+            invalidate_cached_user(obj.id)
+
+
+# Plain `def` so FastAPI runs it in the threadpool instead of blocking the event loop.
+# It stays on the sync session shared with the handler: routers mutate current_user
+# and commit through their own `db`, which only works if both use the same Session.
+def get_current_user(
     db: Session = Depends(get_db),
-    token: Optional[str] = Depends(oauth2_scheme)
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
 ) -> Optional[User]:
-    if not token:
+    if not credentials:
         return None
+    token = credentials.credentials
+
+    key = _token_key(token)
+    with _user_cache_lock:
+        cached = _user_cache.get(key)
+    if cached is not None and cached[0] > time.time():
+        return _user_from_snapshot(db, cached[1])
 
     payload = decode_token(token)
     if not payload:
@@ -32,7 +91,17 @@ async def get_current_user(
     if not user_id:
         return None
 
-    user = db.query(User).filter(User.id == UUID(user_id)).first()
+    try:
+        user_uuid = UUID(user_id)
+    except ValueError:
+        return None
+
+    # Identity-map lookup — no SELECT if the user is already loaded in this session
+    user = db.get(User, user_uuid)
+    if user is not None:
+        snapshot = {col: _copy_value(getattr(user, col)) for col in _USER_COLUMNS}
+        with _user_cache_lock:
+            _user_cache[key] = (payload.get("exp", 0), snapshot)
     return user
 
 async def get_current_active_user(
@@ -52,13 +121,12 @@ async def get_current_active_user(
     return current_user
 
 def require_verification_level(min_level: str):
+    required_level = VERIFICATION_LEVELS.get(min_level, 0)
+
     async def verification_checker(
         current_user: User = Depends(get_current_active_user)
     ):
-        user_level = VERIFICATION_LEVELS.get(current_user.verification_level, 0)
-        required_level = VERIFICATION_LEVELS.get(min_level, 0)
-
-        if user_level < required_level:
+        if VERIFICATION_LEVELS.get(current_user.verification_level, 0) < required_level:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Phone verification required. Please verify your phone number to continue.",
@@ -70,20 +138,25 @@ def require_verification_level(min_level: str):
 # Onboarding allowlist (/auth/me, /auth/me/complete-profile, /otp/*) stays on get_current_active_user.
 get_verified_user = require_verification_level("phone_verified")
 
+# Cached so every route gated on the same capability shares one dependency callable,
+# which FastAPI then resolves once per request.
+@lru_cache(maxsize=None)
 def require_capability(required_capability: str):
+    detail = f"Missing required capability: {required_capability}"
+
     async def capability_checker(
         current_user: User = Depends(get_verified_user)
     ):
-        if required_capability not in current_user.capabilities:
+        if required_capability not in current_user.capabilities_set:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Missing required capability: {required_capability}"
+                detail=detail
             )
         return current_user
     return capability_checker
 
 async def get_admin_user(current_user: User = Depends(get_current_active_user)) -> User:
-    if "admin_access" not in (current_user.capabilities or []):
+    if "admin_access" not in current_user.capabilities_set:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin access required",
@@ -92,14 +165,16 @@ async def get_admin_user(current_user: User = Depends(get_current_active_user))
 
 
 def require_any_capability(required_capabilities: List[str]):
+    required = frozenset(required_capabilities)
+    detail = f"Missing required capability. Need one of: {required_capabilities}"
+
     async def capability_checker(
         current_user: User = Depends(get_verified_user)
     ):
-        user_caps = set(current_user.capabilities)
-        if not any(cap in user_caps for cap in required_capabilities):
+        if required.isdisjoint(current_user.capabilities_set):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Missing required capability. Need one of: {required_capabilities}"
+                detail=detail
             )
         return current_user
     return capability_checker
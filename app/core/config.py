@@ -1,36 +1,60 @@
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
-import os
-
-load_dotenv()
+from functools import lru_cache
+from pathlib import Path
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    # Values come from the environment, then the repo-root `.env` (wherever the process
+    # was started from); the defaults below apply otherwise
+    model_config = SettingsConfigDict(env_file=Path(__file__).resolve().parents[2] / ".env", extra="ignore")
+
     # Database
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "")
+    DATABASE_URL: str = ""
+    # Each worker has two pools, so its connection ceiling is
+    # DB_POOL_SIZE + DB_MAX_OVERFLOW + DB_ASYNC_POOL_SIZE + DB_ASYNC_MAX_OVERFLOW (30 by default)
+    # Sync engine: most routers, scripts; size ≈ concurrent sync DB-bound requests per worker
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    # Async engine: only the register/login/token endpoints
+    DB_ASYNC_POOL_SIZE: int = 5
+    DB_ASYNC_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
     
     # JWT
-    SECRET_KEY: str = os.getenv("SECRET_KEY", "")
-    ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+    SECRET_KEY: str = ""
+    ALGORITHM: str = "HS256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # bcrypt work factor — each +1 doubles hash time; existing hashes keep their own rounds
+    BCRYPT_ROUNDS: int = 12
     
     # App
-    APP_NAME: str = os.getenv("APP_NAME", "Property Management API")
-    DEBUG: bool = os.getenv("DEBUG", "True") == "True"
+    APP_NAME: str = "Property Management API"
+    DEBUG: bool = True
 
     # Paystack
     PAYSTACK_SECRET_KEY: str = ""
     APP_BASE_URL: str = "http://localhost:8000"
 
+    # Media storage (see app/utils/file_storage.py)
+    MEDIA_ROOT: str = "media"
+    BASE_URL: str = "http://localhost:8000"
+
     # Google OAuth — client IDs from Firebase/Google Cloud console
-    GOOGLE_CLIENT_ID_ANDROID: str = os.getenv("GOOGLE_CLIENT_ID_ANDROID", "")
-    GOOGLE_CLIENT_ID_IOS: str = os.getenv("GOOGLE_CLIENT_ID_IOS", "")
-    GOOGLE_CLIENT_ID_WEB: str = os.getenv("GOOGLE_CLIENT_ID_WEB", "")
+    GOOGLE_CLIENT_ID_ANDROID: str = ""
+    GOOGLE_CLIENT_ID_IOS: str = ""
+    GOOGLE_CLIENT_ID_WEB: str = ""
 
     # BulkSMS Nigeria
-    BULKSMS_NIGERIA_API_TOKEN: str = os.getenv("BULKSMS_NIGERIA_API_TOKEN", "")
-    BULKSMS_NIGERIA_SENDER_ID: str = os.getenv("BULKSMS_NIGERIA_SENDER_ID", "RentalGuide")
+    BULKSMS_NIGERIA_API_TOKEN: str = ""
+    BULKSMS_NIGERIA_SENDER_ID: str = "RentalGuide"
 
     # Firebase
-    FIREBASE_SERVICE_ACCOUNT_PATH: str = os.getenv("FIREBASE_SERVICE_ACCOUNT_PATH", "firebase-service-account.json")
+    FIREBASE_SERVICE_ACCOUNT_PATH: str = "firebase-service-account.json"
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings()
+
 
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
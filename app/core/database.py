@@ -1,11 +1,93 @@
+from typing import AsyncGenerator
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
 
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+def _pool_options(url, pool_size: int, max_overflow: int) -> dict:
+    # SQLite (local dev, possibly in-memory) keeps SQLAlchemy's default pool
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    # Both engines: keep warm connections, drop ones Postgres has recycled.
+    # Each engine gets its own share of the per-worker connection budget.
+    return dict(
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
+
+def _executemany_options(url) -> dict:
+    # psycopg2: batch UPDATE/DELETE executemany too; multi-row INSERTs use insertmanyvalues pages
+    if make_url(url).get_backend_name() != "postgresql":
+        return {}
+    options = {"insertmanyvalues_page_size": 1000}
+    if make_url(url).get_driver_name() == "psycopg2":
+        options["executemany_mode"] = "values_plus_batch"
+    return options
+
+
+# Sync engine — Alembic, scripts, and routers that have not moved to AsyncSession yet
+engine = create_engine(
+    settings.DATABASE_URL,
+    **_pool_options(settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+    **_executemany_options(settings.DATABASE_URL),
+)
+# Objects stay loaded after commit; handlers return what they just wrote without a refresh
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Async drivers for the plain URLs in .env (postgresql://..., sqlite:///...)
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+# Query parameters asyncpg.connect() accepts as strings; libpq-only ones
+# (connect_timeout, application_name, sslrootcert, ...) would raise TypeError there
+_ASYNCPG_QUERY_KEYS = frozenset({"ssl", "target_session_attrs", "krbsrvname", "gsslib"})
+
+
+def _async_database_url(url: str):
+    parsed = make_url(url)
+    parsed = parsed.set(drivername=_ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername))
+    if parsed.get_backend_name() != "postgresql":
+        return parsed
+    query = dict(parsed.query)
+    # libpq's sslmode values (disable/allow/prefer/require/verify-ca/verify-full) map onto asyncpg's ssl
+    if "sslmode" in query:
+        query.setdefault("ssl", query.pop("sslmode"))
+    return parsed.set(query={key: value for key, value in query.items() if key in _ASYNCPG_QUERY_KEYS})
+
+
+def _async_connect_args(url) -> dict:
+    if url.get_backend_name() != "postgresql":
+        return {}
+    # asyncpg: skip the JIT planner on short OLTP queries, bound runaway statements,
+    # and keep prepared statements per pooled connection so repeat queries skip parse + plan.
+    # SQLAlchemy prepares statements itself, bypassing asyncpg's own statement_cache_size,
+    # so only the SQLAlchemy-level cache is sized.
+    return {
+        "server_settings": {"jit": "off"},
+        "command_timeout": 60,
+        "prepared_statement_cache_size": 500,
+    }
+
+
+_async_url = _async_database_url(settings.DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    connect_args=_async_connect_args(_async_url),
+    **_pool_options(_async_url, settings.DB_ASYNC_POOL_SIZE, settings.DB_ASYNC_MAX_OVERFLOW),
+    **_executemany_options(_async_url),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -14,4 +96,10 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Async session for IO-bound handlers that don't block the event loop on DB round trips."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,13 +1,46 @@
+import logging
+import time
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from datetime import datetime
+from sqlalchemy import text
+from app.core.database import engine, async_engine
 from app.routers import auth, properties, favorites, inspections, admin_auth, payments, otp, notifications, support, admin_support
 from fastapi.staticfiles import StaticFiles
+import orjson
 import os  
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_sync_pool():
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open a pooled connection on each engine now, so the first request doesn't pay connect + TLS + auth
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        await run_in_threadpool(_warm_sync_pool)
+    except Exception as e:
+        logger.warning(f"Database warm-up failed, continuing startup: {e}")
+    yield
+    await async_engine.dispose()
+    engine.dispose()
+
+
 app = FastAPI(
     title="Nigeria Property App",
     description="Direct property listing platform",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Mount static media folder — images stored here after upload
@@ -36,19 +69,31 @@ app.include_router(notifications.router, prefix="/api/v1")
 app.include_router(support.router, prefix="/api/v1")
 app.include_router(admin_support.router, prefix="/api/v1/admin")
 
-@app.get("/")
-def root():
-    return {
-        "message": "Nigeria Property App API",
-        "version": "1.0.0",
-        "status": "active",
-        "documentation": "/docs"
-    }
-
-@app.get("/health")
-def health_check():
-    return {
-        "status": "healthy",
-        "service": "Nigeria Property App",
-        "timestamp": datetime.utcnow()
-    }
\ No newline at end of file
+# Liveness probes hit these every few seconds per instance — serve pre-serialized bytes
+_ROOT_BODY = orjson.dumps({
+    "message": "Nigeria Property App API",
+    "version": "1.0.0",
+    "status": "active",
+    "documentation": "/docs"
+})
+_HEALTH_TTL_SECONDS = 1.0
+_health_cache = (0.0, b"")  # (monotonic expiry, body)
+
+
+@app.get("/", include_in_schema=False)
+async def root():
+    return Response(content=_ROOT_BODY, media_type="application/json")
+
+@app.get("/health", include_in_schema=False)
+async def health_check():
+    global _health_cache
+    now = time.monotonic()
+    expires_at, body = _health_cache
+    if now >= expires_at:
+        body = orjson.dumps({
+            "status": "healthy",
+            "service": "Nigeria Property App",
+            "timestamp": datetime.utcnow()
+        })
+        _health_cache = (now + _HEALTH_TTL_SECONDS, body)
+    return Response(content=body, media_type="application/json")
@@ -7,6 +7,8 @@ Base = declarative_base()
 
 class BaseModel(Base):
     __abstract__ = True
+    # Fetch created_at / updated_at via RETURNING on INSERT and UPDATE instead of a later SELECT
+    __mapper_args__ = {"eager_defaults": True}
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,9 +1,35 @@
-from sqlalchemy import Column, String, Integer, Float, Boolean, Text, Enum, ForeignKey, JSON, DateTime
+from sqlalchemy import Column, String, Integer, Float, Boolean, Text, Enum, ForeignKey, JSON, DateTime, Index, column, text, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 import enum
 
+# Full-text search (Postgres). Config and weights are SQL literals so the query
+# expression matches the GIN expression index exactly.
+SEARCH_CONFIG = literal_column("'simple'")
+
+# Weight A-D per column group, mirroring the old ILIKE relevance ranking
+_SEARCH_WEIGHTS = (
+    ("A", ("title",)),
+    ("B", ("address", "city")),
+    ("C", ("state", "landmark", "lga")),
+    ("D", ("description",)),
+)
+
+
+def property_search_vector(col):
+    """Weighted tsvector over the searchable text columns; `col` maps a name to a column."""
+    vector = None
+    for weight, names in _SEARCH_WEIGHTS:
+        document = None
+        for name in names:
+            part = func.coalesce(col(name), literal_column("''"))
+            document = part if document is None else document.op("||")(literal_column("' '")).op("||")(part)
+        weighted = func.setweight(func.to_tsvector(SEARCH_CONFIG, document), literal_column(f"'{weight}'"))
+        vector = weighted if vector is None else vector.op("||")(weighted)
+    return vector
+
+
 class PropertyType(str, enum.Enum):
     HOUSE = "house"
     LAND = "land"
@@ -32,15 +58,32 @@ class PropertyVerificationStatus(str, enum.Enum):
     VERIFIED = "verified"
     REJECTED = "rejected"
 
+def _string_enum(enum_cls):
+    """VARCHAR + CHECK constraint instead of a native Postgres ENUM; still loads as the Python enum."""
+    return Enum(enum_cls, native_enum=False, create_constraint=True, length=32)
+
 class Property(BaseModel):
     __tablename__ = "properties"
+    __table_args__ = (
+        # Public listings: only available + verified rows. Enum columns store member names.
+        Index(
+            "ix_props_public", "listing_type", "city",
+            postgresql_where=text("status = 'AVAILABLE' AND verification_status = 'VERIFIED'"),
+        ),
+        # Default listing filter + newest-first sort
+        Index("ix_props_verif_status_created", "verification_status", "status", text("created_at DESC")),
+        Index(
+            "ix_props_search_vector", property_search_vector(column),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
     
     # Basic Info
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=False)
-    property_type = Column(Enum(PropertyType), nullable=False)
-    listing_type = Column(Enum(ListingType), nullable=False)
-    status = Column(Enum(PropertyStatus), default=PropertyStatus.AVAILABLE)
+    property_type = Column(_string_enum(PropertyType), nullable=False)
+    listing_type = Column(_string_enum(ListingType), nullable=False)
+    status = Column(_string_enum(PropertyStatus), default=PropertyStatus.AVAILABLE)
     
     # Location
     address = Column(String(255), nullable=False)
@@ -74,7 +117,7 @@ class Property(BaseModel):
     main_image = Column(String(255), nullable=True)
     
     # Property Verification System
-    verification_status = Column(Enum(PropertyVerificationStatus), default=PropertyVerificationStatus.PENDING_VERIFICATION)
+    verification_status = Column(_string_enum(PropertyVerificationStatus), default=PropertyVerificationStatus.PENDING_VERIFICATION)
     ownership_documents = Column(JSON, default=list)
     verification_notes = Column(Text, nullable=True)
     verified_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
@@ -123,4 +166,7 @@ class PropertyVideo(BaseModel):
     duration = Column(Integer, nullable=True)
     display_order = Column(Integer, default=0)
     
-    property = relationship("Property", back_populates="videos")
\ No newline at end of file
+    property = relationship("Property", back_populates="videos")
+
+
+PROPERTY_SEARCH_VECTOR = property_search_vector(Property.__table__.c.__getitem__)
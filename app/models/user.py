@@ -1,4 +1,6 @@
-from sqlalchemy import Column, String, Boolean, Text, JSON
+from functools import cached_property
+from sqlalchemy import Column, String, Boolean, Text, JSON, bindparam, event, select
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.models.base import BaseModel
 
@@ -10,7 +12,8 @@ class User(BaseModel):
     full_name = Column(String(100), nullable=False)
     password_hash = Column(String(255), nullable=True)
 
-    capabilities = Column(JSON, default=["browse_properties", "save_favorites"])
+    # JSONB on Postgres (binary); plain JSON on SQLite
+    capabilities = Column(JSON().with_variant(JSONB(), "postgresql"), default=["browse_properties", "save_favorites"])
     verification_level = Column(String(20), default="unverified")
 
     is_active = Column(Boolean, default=True)
@@ -38,8 +41,34 @@ class User(BaseModel):
     identification_number = Column(String(50), nullable=True)
     
     from app.models.property import Property
+    # lazy="raise": never load a user's listings implicitly (auth/`/me` paths touch User on
+    # every request). Use selectinload(User.properties) where they are actually needed.
     properties = relationship(
         "Property",
         back_populates="owner",
-        foreign_keys="Property.owner_id"
-    )
\ No newline at end of file
+        foreign_keys="Property.owner_id",
+        lazy="raise",
+    )
+
+    @cached_property
+    def capabilities_set(self) -> frozenset:
+        """Frozen view of `capabilities` for O(1) membership checks; reset whenever the column changes."""
+        return frozenset(self.capabilities or ())
+
+
+@event.listens_for(User.capabilities, "set")
+def _reset_capabilities_set(target, value, oldvalue, initiator):
+    target.__dict__.pop("capabilities_set", None)
+
+
+@event.listens_for(User, "refresh")
+@event.listens_for(User, "expire")
+def _reset_capabilities_set_on_reload(target, *args):
+    # Commit expires identity-map states whose objects may already be garbage collected
+    if target is not None:
+        target.__dict__.pop("capabilities_set", None)
+
+
+# Login lookup for the user and admin auth routers. Built once, so every login sends the
+# same SQL text and hits the per-connection prepared statement cache
+USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
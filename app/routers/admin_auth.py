@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from app.core.database import get_db
-from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.database import get_async_db
+from app.models.user import User, USER_BY_EMAIL
 from app.utils.auth import verify_password, create_access_token
 
 router = APIRouter(tags=["Admin Auth"])
@@ -11,13 +13,13 @@ router = APIRouter(tags=["Admin Auth"])
 @router.post("/auth/token")
 async def admin_login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Admin-only login. Rejects any user who doesn't have 'admin_access' capability.
     Used by the React admin dashboard.
     """
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await db.scalar(USER_BY_EMAIL, {"email": form_data.username})
 
     # Generic error — don't reveal whether email exists or not
     auth_error = HTTPException(
@@ -26,7 +28,7 @@ async def admin_login(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await run_in_threadpool(verify_password, form_data.password, user.password_hash):
         raise auth_error
 
     if not user.is_active:
@@ -36,7 +38,7 @@ async def admin_login(
         )
 
     # ── This is the key check — regular users are blocked here ───────────────
-    if "admin_access" not in (user.capabilities or []):
+    if "admin_access" not in user.capabilities_set:
         raise auth_error
 
     access_token = create_access_token(
@@ -47,7 +49,7 @@ async def admin_login(
         }
     )
 
-    return {
+    return ORJSONResponse({
         "access_token": access_token,
         "token_type": "bearer",
         "user": {
@@ -56,4 +58,4 @@ async def admin_login(
             "email": user.email,
             "capabilities": user.capabilities,
         },
-    }
\ No newline at end of file
+    })
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from app.core.database import get_db
-from app.models.user import User
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import exists, func, select
+from app.core.database import get_db, get_async_db, SessionLocal
+from app.models.user import User, USER_BY_EMAIL
 from app.models.property import Property
 from app.models.favorite import Favorite
 from app.schemas.user import (
@@ -22,28 +25,54 @@ from google.auth.transport import requests as google_requests
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
-@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
-    # Check if email exists
-    if db.query(User).filter(User.email == user_data.email).first():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
+
+def _token_response(access_token: str, user: User, status_code: int = status.HTTP_200_OK) -> ORJSONResponse:
+    """
+    Token endpoints return a Response directly, so FastAPI skips the
+    response_model validate + jsonable_encoder pass (response_model stays for the docs).
+    """
+    return ORJSONResponse(
+        {"access_token": access_token, "token_type": "bearer", "user": UserResponse.from_orm_fast(user).model_dump()},
+        status_code=status_code,
+    )
+
+
+def _send_login_alert(user_id):
+    """Background login alert. Opens its own sync session — the request's session is closed by now."""
+    db = SessionLocal()
+    try:
+        fcm_service.send_to_user(
+            db, user_id,
+            "New sign-in to RentalGuide",
+            "Your account was just signed in to. If this wasn't you, change your password immediately.",
+            {"screen": "privacy"},
         )
-    
-    # Check if phone exists
-    if db.query(User).filter(User.phone_number == user_data.phone_number).first():
+    finally:
+        db.close()
+
+
+@router.post("/register", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    # Check email and phone uniqueness in one round trip
+    email_taken, phone_taken = (await db.execute(select(
+        exists().where(User.email == user_data.email),
+        exists().where(User.phone_number == user_data.phone_number),
+    ))).one()
+    if email_taken or phone_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Phone number already registered"
+            detail="Email already registered" if email_taken else "Phone number already registered"
         )
     
+    # bcrypt is CPU-bound — hash off the event loop
+    password_hash = await run_in_threadpool(get_password_hash, user_data.password)
+
     # Create new user with default capabilities
     user = User(
         email=user_data.email,
         phone_number=user_data.phone_number,
         full_name=user_data.full_name,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=password_hash,
         capabilities=["browse_properties", "save_favorites"],
         verification_level="unverified",
         city=user_data.city,
@@ -55,8 +84,8 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     
     # Create token with capabilities in payload
     access_token = create_access_token(
@@ -67,20 +96,17 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         }
     )
     
-    return TokenResponse(
-        access_token=access_token,
-        user=UserResponse.model_validate(user)
-    )
+    return _token_response(access_token, user, status_code=status.HTTP_201_CREATED)
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
     user_data: UserLogin,
     background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    user = db.query(User).filter(User.email == user_data.email).first()
+    user = await db.scalar(USER_BY_EMAIL, {"email": user_data.email})
 
-    if not user or not verify_password(user_data.password, user.password_hash):
+    if not user or not await run_in_threadpool(verify_password, user_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -102,28 +128,19 @@ async def login(
     )
 
     if user.login_alerts_enabled:
-        background_tasks.add_task(
-            fcm_service.send_to_user,
-            db, user.id,
-            "New sign-in to RentalGuide",
-            "Your account was just signed in to. If this wasn't you, change your password immediately.",
-            {"screen": "privacy"},
-        )
+        background_tasks.add_task(_send_login_alert, user.id)
 
-    return TokenResponse(
-        access_token=access_token,
-        user=UserResponse.model_validate(user)
-    )
+    return _token_response(access_token, user)
 
 @router.post("/token", response_model=dict)
 async def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """OAuth2 compatible token endpoint for Swagger UI"""
-    user = db.query(User).filter(User.email == form_data.username).first()
+    user = await db.scalar(USER_BY_EMAIL, {"email": form_data.username})
     
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await run_in_threadpool(verify_password, form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -144,10 +161,10 @@ async def login_for_access_token(
         }
     )
     
-    return {
+    return ORJSONResponse({
         "access_token": access_token,
         "token_type": "bearer"
-    }
+    })
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_info(
@@ -257,15 +274,9 @@ async def google_auth(request: GoogleAuthRequest, background_tasks: BackgroundTa
     )
 
     if user.login_alerts_enabled:
-        background_tasks.add_task(
-            fcm_service.send_to_user,
-            db, user.id,
-            "New sign-in to RentalGuide",
-            "Your account was just signed in to. If this wasn't you, change your password immediately.",
-            {"screen": "privacy"},
-        )
+        background_tasks.add_task(_send_login_alert, user.id)
 
-    return TokenResponse(access_token=access_token, user=UserResponse.model_validate(user))
+    return _token_response(access_token, user)
 
 
 @router.patch("/me/complete-profile", response_model=UserResponse)
@@ -279,11 +290,11 @@ async def complete_profile(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Profile already completed")
 
     # Phone uniqueness check
-    existing = db.query(User).filter(
+    phone_taken = db.query(exists().where(
         User.phone_number == data.phone_number,
         User.id != current_user.id,
-    ).first()
-    if existing:
+    )).scalar()
+    if phone_taken:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Phone number already registered")
 
     current_user.phone_number = data.phone_number
@@ -332,12 +343,12 @@ async def change_password(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Password change is not available for Google accounts.",
         )
-    if not verify_password(data.current_password, current_user.password_hash):
+    if not await run_in_threadpool(verify_password, data.current_password, current_user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect.",
         )
-    current_user.password_hash = get_password_hash(data.new_password)
+    current_user.password_hash = await run_in_threadpool(get_password_hash, data.new_password)
     db.commit()
     return {"message": "Password changed successfully."}
 
@@ -349,11 +360,11 @@ async def change_phone(
     current_user: User = Depends(get_current_active_user),
 ):
     """Change the user's phone number and reset verification to unverified."""
-    existing = db.query(User).filter(
+    phone_taken = db.query(exists().where(
         User.phone_number == data.phone_number,
         User.id != current_user.id,
-    ).first()
-    if existing:
+    )).scalar()
+    if phone_taken:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Phone number already registered to another account.",
@@ -370,7 +381,7 @@ async def change_phone(
             "verification_level": current_user.verification_level,
         }
     )
-    return TokenResponse(access_token=access_token, user=UserResponse.model_validate(current_user))
+    return _token_response(access_token, current_user)
 
 
 @router.patch("/me/login-alerts", response_model=UserResponse)
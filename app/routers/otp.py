@@ -107,7 +107,8 @@ async def verify_otp(
             detail="Phone already verified.",
         )
 
-    ok = OTPService.verify_otp(db, current_user.phone_number, body.code)
+    # Marking the OTP used commits together with the user upgrade below
+    ok = OTPService.verify_otp(db, current_user.phone_number, body.code, commit=False)
     if not ok:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -115,7 +116,8 @@ async def verify_otp(
         )
 
     # Upgrade verification level
-    current_user.verification_level = "phone_verified"
+    verification_level = "phone_verified"
+    current_user.verification_level = verification_level
 
     # Add phone_verified capability if not already present
     caps = list(current_user.capabilities or [])
@@ -123,15 +125,17 @@ async def verify_otp(
         caps.append("phone_verified")
     current_user.capabilities = caps
 
+    # One commit flushes the OTP and user UPDATEs; the response is built from the
+    # values just written, so no refresh round trip is needed
+    user_id = str(current_user.id)
     db.commit()
-    db.refresh(current_user)
 
     # Issue a fresh JWT reflecting the updated verification level
     access_token = create_access_token(
         data={
-            "sub": str(current_user.id),
-            "capabilities": current_user.capabilities,
-            "verification_level": current_user.verification_level,
+            "sub": user_id,
+            "capabilities": caps,
+            "verification_level": verification_level,
         }
     )
 
@@ -139,5 +143,5 @@ async def verify_otp(
         message="Phone number verified successfully.",
         verified=True,
         access_token=access_token,
-        verification_level=current_user.verification_level,
+        verification_level=verification_level,
     )
@@ -1,22 +1,26 @@
-import json
+import asyncio
+import orjson
+from itertools import chain, islice
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Form, UploadFile, File
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, case, Integer, literal, func, String, text
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import or_, and_, case, Integer, func, update
 from datetime import datetime
 from app.core.database import get_db
 from app.models.property import (
     Property, PropertyType, ListingType, PropertyStatus,
-    PropertyVerificationStatus, PropertyImage, PropertyVideo
+    PropertyVerificationStatus, PropertyImage, PropertyVideo,
+    PROPERTY_SEARCH_VECTOR, SEARCH_CONFIG,
 )
 from app.models.user import User
 from app.schemas.property import (
-    PropertyResponse, PropertyVerificationAction, OwnershipDocument
+    PropertyResponse, PropertyVerificationAction, validate_ownership_documents
 )
 from app.api.deps import get_current_user, get_verified_user, require_capability
 from app.utils.file_storage import save_property_images, delete_property_image
 from app.services.geocoding_service import geocode_address
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 router = APIRouter(prefix="/properties", tags=["Properties"])
@@ -24,39 +28,91 @@ router = APIRouter(prefix="/properties", tags=["Properties"])
 
 # Helpers
 
-def _normalize_property(prop: Property):
-    """Ensure JSON/list fields are not None so response validation passes."""
-    if getattr(prop, "ownership_documents", None) is None:
-        prop.ownership_documents = []
-    return prop
+def _image_rows(property_id, image_urls: List[str], captions: List[str]) -> List[dict]:
+    """PropertyImage rows for one multi-row INSERT instead of one ORM add per image."""
+    return [
+        {
+            "property_id": property_id,
+            "image_url": url,
+            "is_main": idx == 0,
+            "caption": (captions[idx] if idx < len(captions) else None) or None,
+            "display_order": idx,
+        }
+        for idx, url in enumerate(image_urls)
+    ]
+
+
+# Listing filters, built once at import instead of per request
+_PUBLIC_LISTING = and_(
+    Property.status == PropertyStatus.AVAILABLE,
+    Property.verification_status == PropertyVerificationStatus.VERIFIED,
+)
+_PENDING_REVIEW = Property.verification_status == PropertyVerificationStatus.PENDING_VERIFICATION
+_AWAITING_OR_REJECTED = Property.verification_status.in_([
+    PropertyVerificationStatus.PENDING_VERIFICATION,
+    PropertyVerificationStatus.REJECTED,
+])
+
+# Relationships PropertyResponse serializes; loaded in one query each instead of per row
+_PROPERTY_RESPONSE_LOADS = (
+    selectinload(Property.images),
+    selectinload(Property.videos),
+    selectinload(Property.owner),
+)
+
+def _property_list_response(properties: List[Property]) -> ORJSONResponse:
+    """
+    Build responses straight from the DB rows and hand plain Python values (UUID/datetime/enum)
+    to orjson. Returning a Response skips FastAPI's validate + jsonable_encoder pass.
+    """
+    return ORJSONResponse([PropertyResponse.from_orm_fast(prop).model_dump() for prop in properties])
+
+
+_STREAM_BATCH_SIZE = 25
+
+
+def _stream_property_list(query) -> StreamingResponse:
+    """
+    Stream a JSON array, serializing each batch of rows as the cursor yields it,
+    so the whole page is never held in memory at once.
+    The first batch is fetched before the response starts: query errors still
+    surface as a 500 instead of a 200 with a truncated body.
+    """
+    rows = iter(query.yield_per(_STREAM_BATCH_SIZE))
+    first_batch = list(islice(rows, _STREAM_BATCH_SIZE))
+
+    def body():
+        yield b"["
+        separator = b""
+        for prop in chain(first_batch, rows):
+            yield separator + orjson.dumps(PropertyResponse.from_orm_fast(prop).model_dump())
+            separator = b","
+        yield b"]"
 
+    return StreamingResponse(body(), media_type="application/json")
 
-def _parse_verification_document(raw: str) -> List[OwnershipDocument]:
+
+def _parse_verification_document(raw: str) -> List[Dict[str, Any]]:
     """
     Parse the 'verification_document' JSON string sent from the Flutter form.
     Accepts either a single dict or a list of dicts.
-    Returns a list of validated OwnershipDocument objects.
+    Returns a list of plain document dicts with a non-empty 'document_type'.
+    orjson decodes straight to dicts; the only schema is the document_type check.
     """
     try:
-        parsed = json.loads(raw)
-    except (json.JSONDecodeError, TypeError):
+        docs = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="'verification_document' must be a valid JSON string.",
         )
-
-    if isinstance(parsed, dict):
-        parsed = [parsed]
-
-    if not isinstance(parsed, list):
-        raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail="'verification_document' must be a JSON object or array.",
-        )
-
+    if isinstance(docs, dict):
+        docs = [docs]
     try:
-        return [OwnershipDocument(**doc) for doc in parsed]
-    except Exception as e:
+        if not isinstance(docs, list) or not all(isinstance(doc, dict) for doc in docs):
+            raise ValueError("expected a document object or a list of document objects")
+        return validate_ownership_documents(docs)
+    except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail=f"Invalid document structure: {str(e)}",
@@ -68,9 +124,9 @@ def _parse_features(raw: Optional[str]) -> List[str]:
     if not raw:
         return []
     try:
-        result = json.loads(raw)
+        result = orjson.loads(raw)
         return result if isinstance(result, list) else []
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         return []
 
 
@@ -79,9 +135,9 @@ def _parse_captions(raw: Optional[str]) -> List[str]:
     if not raw:
         return []
     try:
-        result = json.loads(raw)
+        result = orjson.loads(raw)
         return result if isinstance(result, list) else []
-    except (json.JSONDecodeError, TypeError):
+    except (orjson.JSONDecodeError, TypeError):
         return []
 
 
@@ -188,7 +244,7 @@ async def create_property(
         available_units=available_units,
         features=parsed_features,
         owner_id=current_user.id,
-        ownership_documents=[doc.model_dump() for doc in ownership_docs],
+        ownership_documents=ownership_docs,
         main_image=image_urls[0] if image_urls else None,
         verification_status=PropertyVerificationStatus.PENDING_VERIFICATION,
         status=PropertyStatus.PENDING,
@@ -196,15 +252,8 @@ async def create_property(
 
     db.add(property_obj)
     db.flush()   
-    for idx, url in enumerate(image_urls):
-        caption = parsed_captions[idx] if idx < len(parsed_captions) else None
-        db.add(PropertyImage(
-            property_id=property_obj.id,
-            image_url=url,
-            is_main=(idx == 0),
-            caption=caption or None,
-            display_order=idx,
-        ))
+    if image_urls:
+        db.bulk_insert_mappings(PropertyImage, _image_rows(property_obj.id, image_urls, parsed_captions))
     if video_url and video_url.strip():
         db.add(PropertyVideo(
             property_id=property_obj.id,
@@ -213,9 +262,6 @@ async def create_property(
         ))
 
     db.commit()
-    db.refresh(property_obj)
-    _normalize_property(property_obj)
-
     return property_obj
 
 
@@ -260,7 +306,7 @@ async def update_property(
     if not prop:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found.")
 
-    is_admin = "admin_access" in current_user.capabilities
+    is_admin = "admin_access" in current_user.capabilities_set
     if prop.owner_id != current_user.id and not is_admin:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You can only update your own properties.")
 
@@ -304,30 +350,23 @@ async def update_property(
     # Oweenership documents
     if verification_document:
         ownership_docs = _parse_verification_document(verification_document)
-        prop.ownership_documents = [doc.model_dump() for doc in ownership_docs]
+        prop.ownership_documents = ownership_docs
         prop.verification_status = PropertyVerificationStatus.PENDING_VERIFICATION
         prop.status = PropertyStatus.PENDING
 
+    stale_urls = set()
     real_images = [f for f in (images or []) if f and f.filename]
     if real_images:
-        old_images = db.query(PropertyImage).filter(PropertyImage.property_id == property_id).all()
-        for old in old_images:
-            delete_property_image(old.image_url)
-        db.query(PropertyImage).filter(PropertyImage.property_id == property_id).delete()
-
+        old_images = db.query(PropertyImage).filter(PropertyImage.property_id == property_id)
+        old_urls = {url for (url,) in old_images.with_entities(PropertyImage.image_url)}
         image_urls = await save_property_images(real_images)
+        old_images.delete(synchronize_session=False)
+        # Content-addressed files may be re-uploaded here; unlinked only after commit
+        stale_urls = old_urls.difference(image_urls)
         parsed_captions = _parse_captions(image_captions)
 
         prop.main_image = image_urls[0]
-        for idx, url in enumerate(image_urls):
-            caption = parsed_captions[idx] if idx < len(parsed_captions) else None
-            db.add(PropertyImage(
-                property_id=prop.id,
-                image_url=url,
-                is_main=(idx == 0),
-                caption=caption or None,
-                display_order=idx,
-            ))
+        db.bulk_insert_mappings(PropertyImage, _image_rows(prop.id, image_urls, parsed_captions))
     if video_url is not None:
         db.query(PropertyVideo).filter(PropertyVideo.property_id == property_id).delete()
         if video_url.strip():
@@ -338,8 +377,15 @@ async def update_property(
             ))
 
     db.commit()
-    db.refresh(prop)
-    _normalize_property(prop)
+
+    if stale_urls:
+        # Re-check after commit: other listings may share a file with the replaced images
+        stale_urls.difference_update(
+            url for (url,) in db.query(PropertyImage.image_url)
+            .filter(PropertyImage.image_url.in_(stale_urls))
+            .distinct()
+        )
+        await asyncio.gather(*(asyncio.to_thread(delete_property_image, url) for url in stale_urls))
     return prop
 
 
@@ -368,39 +414,33 @@ async def list_properties(
 ):
     """List verified properties with filtering and sorting."""
 
-    query = db.query(Property).filter(
-        func.lower(Property.status.cast(String)) == PropertyStatus.AVAILABLE.value,
-        func.lower(Property.verification_status.cast(String)) == PropertyVerificationStatus.VERIFIED.value,
-    )
+    query = db.query(Property).options(*_PROPERTY_RESPONSE_LOADS).filter(_PUBLIC_LISTING)
 
     if show_pending and current_user:
-        query = db.query(Property).filter(
+        query = db.query(Property).options(*_PROPERTY_RESPONSE_LOADS).filter(
             or_(
-                and_(
-                    func.lower(Property.status.cast(String)) == PropertyStatus.AVAILABLE.value,
-                    func.lower(Property.verification_status.cast(String)) == PropertyVerificationStatus.VERIFIED.value,
-                ),
-                and_(
-                    Property.owner_id == current_user.id,
-                    func.lower(Property.verification_status.cast(String)).in_([
-                        PropertyVerificationStatus.PENDING_VERIFICATION.value,
-                        PropertyVerificationStatus.REJECTED.value,
-                    ]),
-                ),
+                _PUBLIC_LISTING,
+                and_(Property.owner_id == current_user.id, _AWAITING_OR_REJECTED),
             )
         )
 
-    if search:
+    if search and db.get_bind().dialect.name == "postgresql":
+        # Matched through the GIN index on the weighted search vector
+        ts_query = func.plainto_tsquery(SEARCH_CONFIG, search)
+        query = query.filter(PROPERTY_SEARCH_VECTOR.op("@@")(ts_query))
+        relevance_expr = func.ts_rank(PROPERTY_SEARCH_VECTOR, ts_query)
+    elif search:
+        # No full-text index outside Postgres (local SQLite); rank by ILIKE hits
         search_term = f"%{search}%"
-        relevance = (
-            case((Property.title.ilike(f"%{search}%"), 10), else_=0).cast(Integer)
+        relevance_expr = (
+            case((Property.title.ilike(search_term), 10), else_=0).cast(Integer)
             + case((Property.address.ilike(search_term), 8), else_=0).cast(Integer)
             + case((Property.city.ilike(search_term), 7), else_=0).cast(Integer)
             + case((Property.state.ilike(search_term), 6), else_=0).cast(Integer)
             + case((Property.landmark.ilike(search_term), 5), else_=0).cast(Integer)
             + case((Property.lga.ilike(search_term), 4), else_=0).cast(Integer)
             + case((Property.description.ilike(search_term), 3), else_=0).cast(Integer)
-        ).label("relevance")
+        )
 
         query = query.filter(
             or_(
@@ -413,9 +453,6 @@ async def list_properties(
                 Property.lga.ilike(search_term),
             )
         )
-        query = query.add_columns(relevance)
-    else:
-        query = query.add_columns(literal(0).label("relevance"))
 
     if state:
         query = query.filter(Property.state.ilike(f"%{state}%"))
@@ -441,27 +478,21 @@ async def list_properties(
     if has_nearby:
         query = query.filter(Property.latitude.isnot(None), Property.longitude.isnot(None))
 
-        def _haversine_expr():
-            return 6371 * func.acos(
-                func.least(1.0, func.greatest(-1.0,
-                    func.cos(func.radians(near_lat))
-                    * func.cos(func.radians(Property.latitude))
-                    * func.cos(func.radians(Property.longitude) - func.radians(near_lng))
-                    + func.sin(func.radians(near_lat))
-                    * func.sin(func.radians(Property.latitude))
-                ))
-            )
-
-        distance_expr = _haversine_expr().label("distance_km")
-        query = query.add_columns(distance_expr)
-        query = query.filter(_haversine_expr() <= radius_km)
-    else:
-        query = query.add_columns(literal(0.0).label("distance_km"))
+        distance_expr = 6371 * func.acos(
+            func.least(1.0, func.greatest(-1.0,
+                func.cos(func.radians(near_lat))
+                * func.cos(func.radians(Property.latitude))
+                * func.cos(func.radians(Property.longitude) - func.radians(near_lng))
+                + func.sin(func.radians(near_lat))
+                * func.sin(func.radians(Property.latitude))
+            ))
+        )
+        query = query.filter(distance_expr <= radius_km)
 
     if search and sort_by == "relevance":
-        query = query.order_by(text("relevance DESC"), Property.created_at.desc())
+        query = query.order_by(relevance_expr.desc(), Property.created_at.desc())
     elif has_nearby and sort_by == "distance":
-        query = query.order_by(text("distance_km ASC"))
+        query = query.order_by(distance_expr.asc())
     elif sort_by == "oldest":
         query = query.order_by(Property.created_at.asc())
     elif sort_by == "price_low":
@@ -473,14 +504,7 @@ async def list_properties(
     else:
         query = query.order_by(Property.created_at.desc())
 
-    results = query.offset(skip).limit(limit).all()
-    # Unpack: tuples are (Property, relevance, distance_km) or (Property, distance_km) depending on search
-    properties = []
-    for r in results:
-        prop = r[0]
-        _normalize_property(prop)
-        properties.append(prop)
-    return properties
+    return _stream_property_list(query.offset(skip).limit(limit))
 
 
 # Admin List Pending
@@ -494,15 +518,14 @@ async def list_pending_properties(
     """List all pending-verification properties. Admin only."""
     properties = (
         db.query(Property)
-        .filter(Property.verification_status == PropertyVerificationStatus.PENDING_VERIFICATION)
+        .options(*_PROPERTY_RESPONSE_LOADS)
+        .filter(_PENDING_REVIEW)
         .order_by(Property.created_at.desc())
         .offset(skip)
         .limit(limit)
         .all()
     )
-    for p in properties:
-        _normalize_property(p)
-    return properties
+    return _property_list_response(properties)
 
 
 # Admin Verify
@@ -545,8 +568,6 @@ async def verify_property(
     )
 
     db.commit()
-    db.refresh(prop)
-    _normalize_property(prop)
     return prop
 
 
@@ -564,15 +585,14 @@ async def get_user_properties(
     """
     properties = (
         db.query(Property)
+        .options(*_PROPERTY_RESPONSE_LOADS)
         .filter(Property.owner_id == current_user.id)
         .order_by(Property.created_at.desc())
         .offset(skip)
         .limit(limit)
         .all()
     )
-    for p in properties:
-        _normalize_property(p)
-    return properties
+    return _property_list_response(properties)
 
 
 # Detail Public
@@ -582,12 +602,18 @@ async def get_property(
     db: Session = Depends(get_db),
 ):
     """Get a single property. Public — no auth required. Increments view count."""
-    prop = db.query(Property).filter(Property.id == property_id).first()
+    # Single round trip; increments in the database so concurrent views are not lost
+    stmt = (
+        update(Property)
+        .where(Property.id == property_id)
+        .values(view_count=Property.view_count + 1)
+        .returning(Property)
+        .options(*_PROPERTY_RESPONSE_LOADS)
+    )
+    prop = db.execute(stmt).scalar_one_or_none()
     if not prop:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Property not found.")
 
-    prop.view_count += 1
     db.commit()
-    db.refresh(prop)
-    _normalize_property(prop)
-    return prop
\ No newline at end of file
+    # A Response skips FastAPI's re-validation against response_model, like the list endpoints
+    return ORJSONResponse(PropertyResponse.from_orm_fast(prop).model_dump())
\ No newline at end of file
@@ -0,0 +1,7 @@
+class FromOrmFastMixin:
+    """For response schemas built from DB rows on hot read paths."""
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Build from a trusted DB row without running validation. Never use on client input."""
+        return cls.model_construct(**{field: getattr(obj, field) for field in cls.model_fields})
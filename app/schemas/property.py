@@ -1,7 +1,8 @@
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import datetime
+from app.schemas.base import FromOrmFastMixin
 from app.models.property import PropertyType, ListingType, PropertyStatus, PropertyVerificationStatus
 
 
@@ -17,7 +18,7 @@ class PropertyImageCreate(PropertyImageBase):
     pass
 
 
-class PropertyImageResponse(PropertyImageBase):
+class PropertyImageResponse(FromOrmFastMixin, PropertyImageBase):
     id: UUID
     property_id: UUID
     created_at: datetime
@@ -41,7 +42,7 @@ class PropertyVideoCreate(PropertyVideoBase):
     pass
 
 
-class PropertyVideoResponse(PropertyVideoBase):
+class PropertyVideoResponse(FromOrmFastMixin, PropertyVideoBase):
     id: UUID
     property_id: UUID
     created_at: datetime
@@ -64,17 +65,14 @@ class PropertyVideoResponse(PropertyVideoBase):
 #   "issuing_ministry": "Ministry of Lands, Lagos"
 # }
 
-class OwnershipDocument(BaseModel):
-    document_type: str
-    # All other keys are dynamic — accepted as extra fields
-    model_config = {"extra": "allow"}
-
-    @field_validator("document_type")
-    @classmethod
-    def document_type_must_not_be_empty(cls, v: str) -> str:
-        if not v or not v.strip():
+def validate_ownership_documents(docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Check and strip the one required key in place; all other keys are dynamic and kept as-is."""
+    for doc in docs:
+        document_type = doc.get("document_type")
+        if not isinstance(document_type, str) or not document_type.strip():
             raise ValueError("document_type must not be empty")
-        return v.strip()
+        doc["document_type"] = document_type.strip()
+    return docs
 
 
 # Property Base
@@ -99,16 +97,21 @@ class PropertyBase(BaseModel):
     plot_size: Optional[str] = None
     total_units: Optional[int] = None      
     available_units: Optional[int] = None  
-    features: Optional[List[str]] = []
+    features: List[str] = Field(default_factory=list)
 
 
 # Create Schema (used internally after parsing multipart form) 
 
 class PropertyCreate(PropertyBase):
     # Parsed from the JSON string sent in the multipart 'verification_document' field
-    ownership_documents: List[OwnershipDocument] = []
-    images: List[PropertyImageCreate] = []
-    videos: List[PropertyVideoCreate] = []
+    ownership_documents: List[Dict[str, Any]] = Field(default_factory=list)
+    images: List[PropertyImageCreate] = Field(default_factory=list)
+    videos: List[PropertyVideoCreate] = Field(default_factory=list)
+
+    @field_validator("ownership_documents")
+    @classmethod
+    def ownership_documents_have_type(cls, v: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return validate_ownership_documents(v)
 
 
 # Response Schema 
@@ -118,7 +121,7 @@ class PropertyResponse(PropertyBase):
     status: PropertyStatus
     verification_status: PropertyVerificationStatus
     # Returns full document dicts so admin panel / app can display all fields
-    ownership_documents: List[Dict[str, Any]] = []
+    ownership_documents: List[Dict[str, Any]] = Field(default_factory=list)
     verification_notes: Optional[str] = None
     verified_by: Optional[UUID] = None
     verified_at: Optional[datetime] = None
@@ -128,14 +131,30 @@ class PropertyResponse(PropertyBase):
     view_count: int
     is_featured: bool
     main_image: Optional[str] = None
-    images: List[PropertyImageResponse] = []
-    videos: List[PropertyVideoResponse] = []
+    images: List[PropertyImageResponse] = Field(default_factory=list)
+    videos: List[PropertyVideoResponse] = Field(default_factory=list)
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+    @field_validator("ownership_documents", "features", mode="before")
+    @classmethod
+    def null_collections_default(cls, v):
+        # Rows created before the column default existed hold NULL
+        return [] if v is None else v
+
+    @classmethod
+    def from_orm_fast(cls, obj):
+        """Like FromOrmFastMixin.from_orm_fast, plus the nested image/video lists. Trusted DB rows only."""
+        data = {field: getattr(obj, field) for field in cls.model_fields}
+        data["ownership_documents"] = data["ownership_documents"] or []
+        data["features"] = data["features"] or []
+        data["images"] = [PropertyImageResponse.from_orm_fast(image) for image in obj.images]
+        data["videos"] = [PropertyVideoResponse.from_orm_fast(video) for video in obj.videos]
+        return cls.model_construct(**data)
+
 
 # Admin Verification Action
 class PropertyVerificationAction(BaseModel):
@@ -1,22 +1,9 @@
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
-import re
-
-# Nigerian phone number validation
-def validate_nigerian_phone(phone: str) -> str:
-    phone = re.sub(r'[\s\-]', '', phone)
-
-    if not re.match(r'^(0|\+234|234)[789]\d{9}$', phone):
-        raise ValueError('Invalid Nigerian phone number')
-
-    if phone.startswith('0'):
-        phone = '+234' + phone[1:]
-    elif phone.startswith('234'):
-        phone = '+' + phone
-
-    return phone
+from app.schemas.base import FromOrmFastMixin
+from app.utils.phone import NigerianPhone
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -29,16 +16,11 @@ class UserBase(BaseModel):
 
 class UserCreate(UserBase):
     # Local signup — phone, city, state are required
-    phone_number: str
+    phone_number: NigerianPhone
     city: str
     state: str
     password: str = Field(..., min_length=8)
 
-    @field_validator('phone_number')
-    @classmethod
-    def validate_phone(cls, v):
-        return validate_nigerian_phone(v)
-
 class UserLogin(BaseModel):
     email: EmailStr
     password: str
@@ -47,28 +29,18 @@ class GoogleAuthRequest(BaseModel):
     id_token: str
 
 class CompleteProfileRequest(BaseModel):
-    phone_number: str
+    phone_number: NigerianPhone
     city: str
     state: str
     lga: Optional[str] = None
     address: Optional[str] = None
 
-    @field_validator('phone_number')
-    @classmethod
-    def validate_phone(cls, v):
-        return validate_nigerian_phone(v)
-
 class ChangePasswordRequest(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8)
 
 class ChangePhoneRequest(BaseModel):
-    phone_number: str
-
-    @field_validator('phone_number')
-    @classmethod
-    def validate_phone(cls, v):
-        return validate_nigerian_phone(v)
+    phone_number: NigerianPhone
 
 class LoginAlertsRequest(BaseModel):
     enabled: bool
@@ -81,7 +53,7 @@ class NotificationPreferencesRequest(BaseModel):
     promotional_enabled: Optional[bool] = None
     email_enabled: Optional[bool] = None
 
-class UserResponse(UserBase):
+class UserResponse(FromOrmFastMixin, UserBase):
     id: UUID
     capabilities: List[str]
     verification_level: str
@@ -1,5 +1,7 @@
+import hmac
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from app.models.otp import OTPVerification
@@ -23,18 +25,24 @@ class OTPService:
         return "".join(code)
 
     @staticmethod
-    def _check_rate_limit(db: Session, phone: str) -> None:
-        now = datetime.utcnow()
-
-        # 60-second cooldown: reject if the most recent OTP was created too recently
-        last = (
-            db.query(OTPVerification)
+    def _check_rate_limit(db: Session, phone: str, now: datetime) -> None:
+        # One aggregate query serves both the cooldown and the daily limit
+        since = now - timedelta(hours=24)
+        last_created_at, count = (
+            db.query(
+                func.max(OTPVerification.created_at),
+                func.count(OTPVerification.id).filter(OTPVerification.created_at >= since),
+            )
             .filter(OTPVerification.phone == phone)
-            .order_by(OTPVerification.created_at.desc())
-            .first()
+            .one()
         )
-        if last and last.created_at:
-            elapsed = (now - last.created_at).total_seconds()
+
+        # 60-second cooldown: reject if the most recent OTP was created too recently
+        if last_created_at:
+            if last_created_at.tzinfo is not None:
+                # created_at is timezone-aware on Postgres; compare in naive UTC like `now`
+                last_created_at = last_created_at.astimezone(timezone.utc).replace(tzinfo=None)
+            elapsed = (now - last_created_at).total_seconds()
             if elapsed < RESEND_COOLDOWN_SECONDS:
                 wait = int(RESEND_COOLDOWN_SECONDS - elapsed)
                 raise HTTPException(
@@ -43,15 +51,6 @@ class OTPService:
                 )
 
         # Daily limit: max 10 OTPs per phone per 24 hours
-        since = now - timedelta(hours=24)
-        count = (
-            db.query(OTPVerification)
-            .filter(
-                OTPVerification.phone == phone,
-                OTPVerification.created_at >= since,
-            )
-            .count()
-        )
         if count >= DAILY_LIMIT:
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -60,8 +59,9 @@ class OTPService:
 
     @staticmethod
     def create_otp(db: Session, phone: str, check_rate_limit: bool = True) -> OTPVerification:
+        now = datetime.utcnow()
         if check_rate_limit:
-            OTPService._check_rate_limit(db, phone)
+            OTPService._check_rate_limit(db, phone, now)
 
         # Invalidate any previous active OTPs for this phone
         db.query(OTPVerification).filter(
@@ -73,27 +73,31 @@ class OTPService:
             phone=phone,
             otp_code=OTPService.generate_code(),
             is_used=False,
-            expires_at=datetime.utcnow() + timedelta(minutes=OTPService.OTP_EXPIRY_MINUTES),
+            expires_at=now + timedelta(minutes=OTPService.OTP_EXPIRY_MINUTES),
         )
         db.add(otp)
         db.commit()
-        db.refresh(otp)
         return otp
 
     @staticmethod
-    def verify_otp(db: Session, phone: str, code: str) -> bool:
+    def verify_otp(db: Session, phone: str, code: str, commit: bool = True) -> bool:
         record = (
             db.query(OTPVerification)
             .filter(
                 OTPVerification.phone == phone,
-                OTPVerification.otp_code == code.strip().upper(),
                 OTPVerification.is_used == False,
                 OTPVerification.expires_at > datetime.utcnow(),
             )
+            .order_by(OTPVerification.created_at.desc())
             .first()
         )
-        if record is None:
+        # Compare in constant time rather than matching the code in SQL; bytes, since
+        # compare_digest rejects non-ASCII str input (e.g. full-width digits)
+        if record is None or not hmac.compare_digest(
+            record.otp_code.encode(), code.strip().upper().encode()
+        ):
             return False
         record.is_used = True
-        db.commit()
+        if commit:
+            db.commit()
         return True
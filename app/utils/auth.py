@@ -1,5 +1,8 @@
 import bcrypt
-from jose import JWTError, jwt
+import time
+from functools import lru_cache
+import jwt
+from jwt import PyJWTError
 from datetime import datetime, timedelta
 from typing import Optional, Dict
 from app.core.config import settings
@@ -11,7 +14,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
@@ -26,9 +29,24 @@ def create_access_token(data: Dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
+# Decoded payloads are reused for the same token within a 30s bucket
+_DECODE_CACHE_BUCKET_SECONDS = 30
+
+
+@lru_cache(maxsize=4096)
+def _decode_cached(token: str, now_bucket: int) -> Dict:
+    # PyJWTError is raised, never cached — bad tokens are re-checked every time
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
 def decode_token(token: str):
+    """Return the verified payload, or None. The payload is shared with the cache — don't mutate it."""
+    now = time.time()
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
-        return None
\ No newline at end of file
+        payload = _decode_cached(token, int(now) // _DECODE_CACHE_BUCKET_SECONDS)
+    except PyJWTError:
+        return None
+    # A cached payload can outlive the token's exp by up to one bucket
+    if payload.get("exp", 0) <= now:
+        return None
+    return payload
\ No newline at end of file
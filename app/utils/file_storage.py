@@ -6,45 +6,68 @@ Swap out `save_upload_file` internals later for S3 / Cloudinary / etc.
 without touching any router code.
 """
 
+import asyncio
+import hashlib
 import os
-import uuid
-import aiofiles
 from fastapi import UploadFile, HTTPException, status
 from pathlib import Path
+from types import MappingProxyType
+from app.core.config import settings
 
 # ─── Config ───────────────────────────────────────────────────────────────────
 # Set MEDIA_ROOT env var in production to point to your persistent volume.
 # Defaults to ./media/properties relative to where the app runs.
 
-MEDIA_ROOT = Path(os.getenv("MEDIA_ROOT", "media"))
+MEDIA_ROOT = Path(settings.MEDIA_ROOT)
 PROPERTY_IMAGES_DIR = MEDIA_ROOT / "properties"
 
 # Base URL served by your FastAPI static files mount (or a CDN prefix)
 # e.g. https://api.yourapp.com  →  https://api.yourapp.com/media/properties/abc.jpg
-BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
+BASE_URL = settings.BASE_URL
 
-ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp"}
-ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
 MAX_IMAGE_SIZE_MB = 10
 MAX_IMAGE_SIZE_BYTES = MAX_IMAGE_SIZE_MB * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # keeps memory per upload bounded to 1MB
+CONTENT_HASH_CHARS = 24  # 96 bits of SHA-256 names each stored image
 
-# Map file extensions → canonical content type
-_EXT_TO_CONTENT_TYPE = {
-    ".jpg": "image/jpeg",
-    ".jpeg": "image/jpeg",
-    ".png": "image/png",
-    ".webp": "image/webp",
-}
+# MIME type or file extension → (canonical content type, stored extension)
+_IMAGE_TYPES = MappingProxyType({
+    "image/jpeg": ("image/jpeg", ".jpg"),
+    "image/png": ("image/png", ".png"),
+    "image/webp": ("image/webp", ".webp"),
+    ".jpg": ("image/jpeg", ".jpg"),
+    ".jpeg": ("image/jpeg", ".jpg"),
+    ".png": ("image/png", ".png"),
+    ".webp": ("image/webp", ".webp"),
+})
+ALLOWED_IMAGE_TYPES = frozenset(key for key in _IMAGE_TYPES if not key.startswith("."))
+ALLOWED_EXTENSIONS = frozenset(key for key in _IMAGE_TYPES if key.startswith("."))
 
-_CONTENT_TYPE_TO_EXT = {
-    "image/jpeg": ".jpg",
-    "image/png": ".png",
-    "image/webp": ".webp",
-}
+
+_dirs_ready = False
 
 
 def _ensure_dirs():
+    # The directory outlives the process once created; skip the mkdir syscall after that
+    global _dirs_ready
+    if _dirs_ready:
+        return
     PROPERTY_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    _dirs_ready = True
+
+
+def _fsync_images_dir():
+    """Persist the directory entries (renames) for a batch of images with one fsync; file data is fsynced per file."""
+    try:
+        fd = os.open(PROPERTY_IMAGES_DIR, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return  # Directories can't be opened for fsync on Windows
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
 
 
 def _resolve_content_type(file: UploadFile) -> tuple[str, str]:
@@ -58,15 +81,16 @@ def _resolve_content_type(file: UploadFile) -> tuple[str, str]:
     content_type = (file.content_type or "").lower()
 
     # If the client gave us a proper image MIME type, use it directly
-    if content_type in ALLOWED_IMAGE_TYPES:
-        return content_type, _CONTENT_TYPE_TO_EXT[content_type]
+    resolved = _IMAGE_TYPES.get(content_type)
+    if resolved:
+        return resolved
 
     # Fall back to file extension (handles octet-stream from iOS simulator)
     filename = file.filename or ""
-    ext = Path(filename).suffix.lower()
-    if ext in ALLOWED_EXTENSIONS:
-        resolved_type = _EXT_TO_CONTENT_TYPE[ext]
-        return resolved_type, ext if ext != ".jpeg" else ".jpg"
+    _, dot, tail = filename.rpartition(".")
+    resolved = _IMAGE_TYPES.get("." + tail.lower()) if dot else None
+    if resolved:
+        return resolved
 
     raise HTTPException(
         status_code=status.HTTP_400_BAD_REQUEST,
@@ -83,48 +107,117 @@ async def save_property_image(file: UploadFile) -> str:
     Validate, save an uploaded image file, and return its public URL.
 
     Raises HTTPException on invalid type or oversized file.
-    Returns: full URL string, e.g. 'http://localhost:8000/media/properties/uuid.jpg'
+    Returns: full URL string, e.g. 'http://localhost:8000/media/properties/<sha256 prefix>.jpg'
     """
-    _ensure_dirs()
+    return (await save_property_images([file]))[0]
+
 
+def _check_upload(file: UploadFile) -> str:
+    """Type and declared-size checks that need no disk I/O. Returns the file extension."""
     # ── Resolve content type (handles iOS octet-stream) ───────────────────────
     _content_type, ext = _resolve_content_type(file)
 
-    # ── Read file bytes ───────────────────────────────────────────────────────
-    contents = await file.read()
-    if len(contents) > MAX_IMAGE_SIZE_BYTES:
+    # ── Fail fast when the multipart parser already knows the size ───────────
+    if file.size is not None and file.size > MAX_IMAGE_SIZE_BYTES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Image '{file.filename}' exceeds {MAX_IMAGE_SIZE_MB}MB limit.",
         )
+    return ext
 
-    # ── Save to disk ──────────────────────────────────────────────────────────
-    filename = f"{uuid.uuid4().hex}{ext}"
-    file_path = PROPERTY_IMAGES_DIR / filename
 
-    async with aiofiles.open(file_path, "wb") as out:
-        await out.write(contents)
+def _copy_upload(file: UploadFile, file_path: Path) -> str:
+    """
+    Copy the spooled upload to `file_path` in fixed-size chunks with raw os.write calls,
+    hashing as it goes. Returns the SHA-256 hex digest of the contents.
+    Runs in a worker thread, so chunks never round-trip through the event loop.
+    """
+    src = file.file
+    src.seek(0)
+    digest = hashlib.sha256()
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = 0
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > MAX_IMAGE_SIZE_BYTES:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Image '{file.filename}' exceeds {MAX_IMAGE_SIZE_MB}MB limit.",
+                )
+            digest.update(chunk)
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+        # Data must be on disk before the rename makes the image visible under its final name
+        os.fsync(fd)
+        # Served later straight from disk; the pages are clean now, so DONTNEED can drop them
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, written, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return digest.hexdigest()
+
+
+def _save_batch(uploads: list[tuple[UploadFile, str]]) -> list[str]:
+    """
+    Write a whole batch of checked uploads from one worker thread and return their URLs.
 
-    # ── Return public URL ─────────────────────────────────────────────────────
-    return f"{BASE_URL}/media/properties/{filename}"
+    Files are named by content hash, so re-uploading an image already on disk
+    reuses the stored copy. If any write fails, only the temp file being written
+    is removed: a finished image may already be shared with a concurrent upload,
+    so it stays (unreferenced copies are harmless and get reused by hash).
+    """
+    _ensure_dirs()
+    names: list[str] = []
+    tmp_path = None
+    try:
+        for file, ext in uploads:
+            # Dot-prefixed temp name: never matches a stored image or a deletable URL
+            tmp_path = PROPERTY_IMAGES_DIR / f".{os.urandom(16).hex()}.part"
+            name = f"{_copy_upload(file, tmp_path)[:CONTENT_HASH_CHARS]}{ext}"
+            file_path = PROPERTY_IMAGES_DIR / name
+            if file_path.exists():
+                tmp_path.unlink()
+            else:
+                os.replace(tmp_path, file_path)
+            tmp_path = None
+            names.append(name)
+        _fsync_images_dir()
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+    # ── Return public URLs ────────────────────────────────────────────────────
+    return [f"{BASE_URL}/media/properties/{name}" for name in names]
 
 
 async def save_property_images(files: list[UploadFile]) -> list[str]:
-    """Save multiple images and return their URLs in order."""
-    urls = []
-    for f in files:
-        url = await save_property_image(f)
-        urls.append(url)
-    return urls
+    """
+    Save multiple images and return their URLs in order.
+
+    Every file is type/size-checked before any disk I/O; the writes then run as a
+    single threadpool job, so the event loop is suspended once per batch rather
+    than once per file. A failed upload leaves no partial files behind.
+    """
+    if not files:
+        return []
+    exts = [_check_upload(f) for f in files]
+    return await asyncio.to_thread(_save_batch, list(zip(files, exts)))
 
 
 def delete_property_image(image_url: str):
     """
     Delete an image file from disk given its full URL.
-    Safe to call even if the file doesn't exist.
+    Safe to call even if the file doesn't exist. Files are shared by content,
+    so only call this once no property_images row references the URL.
     """
     try:
-        filename = image_url.split("/media/properties/")[-1]
+        filename = image_url.rpartition("/media/properties/")[2]
+        # Only bare filenames we generated; never follow a path out of the images dir
+        if not filename or "/" in filename or "\\" in filename or filename.startswith("."):
+            return
         file_path = PROPERTY_IMAGES_DIR / filename
         if file_path.exists():
             file_path.unlink()
@@ -0,0 +1,22 @@
+import re
+from typing import Annotated
+from pydantic import AfterValidator
+
+# Built once at import; validators run on every signup / profile / phone change
+# Deletes '-' and every character `\s` would match (all str.isspace() chars lie at or below U+3000)
+_PHONE_STRIP_TABLE = str.maketrans('', '', '-' + ''.join(c for c in map(chr, range(0x3001)) if c.isspace()))
+# Prefix (0, 234 or +234) is consumed; the 10-digit subscriber number is captured
+_NG_PHONE_RE = re.compile(r'^(?:0|\+?234)([789]\d{9})$')
+
+
+# Nigerian phone number validation
+def validate_nigerian_phone(phone: str) -> str:
+    match = _NG_PHONE_RE.match(phone.translate(_PHONE_STRIP_TABLE))
+    if not match:
+        raise ValueError('Invalid Nigerian phone number')
+
+    return '+234' + match.group(1)
+
+
+# Field type for request schemas: pydantic-core calls the validator directly after str validation
+NigerianPhone = Annotated[str, AfterValidator(validate_nigerian_phone)]
@@ -15,6 +15,7 @@ import os
 # Make sure app is importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from sqlalchemy import exists, select
 from app.core.database import SessionLocal
 from app.models.user import User
 from app.utils.auth import get_password_hash
@@ -48,12 +49,16 @@ def create_admin():
 
     db = SessionLocal()
     try:
-        # Check for duplicates
-        if db.query(User).filter(User.email == email).first():
+        # Check for duplicates — two EXISTS probes in one round trip, no row hydration
+        email_taken, phone_taken = db.execute(select(
+            exists().where(User.email == email),
+            exists().where(User.phone_number == phone_number),
+        )).one()
+        if email_taken:
             print(f"❌ Email '{email}' is already registered.")
             sys.exit(1)
 
-        if db.query(User).filter(User.phone_number == phone_number).first():
+        if phone_taken:
             print(f"❌ Phone '{phone_number}' is already registered.")
             sys.exit(1)
 
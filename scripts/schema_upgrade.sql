@@ -0,0 +1,64 @@
+-- Schema changes made in the models that existing PostgreSQL databases need applied by hand.
+-- No Alembic revisions are checked in and the app never calls create_all, so model-level
+-- column types and indexes only reach a database through this file.
+--
+--   psql "$DATABASE_URL" -f scripts/schema_upgrade.sql
+--
+-- Every statement is safe to re-run. Sections are in the order the model changes landed.
+
+
+-- ─── properties: enum columns as VARCHAR(32) + CHECK instead of native ENUM types ─────────
+-- Stored values stay the member names ('AVAILABLE', 'VERIFIED', ...), so rows convert in place.
+BEGIN;
+ALTER TABLE properties
+    ALTER COLUMN property_type TYPE VARCHAR(32) USING property_type::text,
+    ALTER COLUMN listing_type TYPE VARCHAR(32) USING listing_type::text,
+    ALTER COLUMN status TYPE VARCHAR(32) USING status::text,
+    ALTER COLUMN verification_status TYPE VARCHAR(32) USING verification_status::text;
+
+ALTER TABLE properties
+    DROP CONSTRAINT IF EXISTS propertytype,
+    DROP CONSTRAINT IF EXISTS listingtype,
+    DROP CONSTRAINT IF EXISTS propertystatus,
+    DROP CONSTRAINT IF EXISTS propertyverificationstatus;
+ALTER TABLE properties
+    ADD CONSTRAINT propertytype CHECK (property_type IN ('HOUSE', 'LAND', 'COMMERCIAL', 'SHOP', 'OFFICE', 'WAREHOUSE', 'EVENT_CENTER', 'SHORTLET')),
+    ADD CONSTRAINT listingtype CHECK (listing_type IN ('RENT', 'SALE', 'LEASE', 'SHORTLET')),
+    ADD CONSTRAINT propertystatus CHECK (status IN ('AVAILABLE', 'RENTED', 'SOLD', 'PENDING', 'UNAVAILABLE')),
+    ADD CONSTRAINT propertyverificationstatus CHECK (verification_status IN ('PENDING_VERIFICATION', 'VERIFIED', 'REJECTED'));
+
+DROP TYPE IF EXISTS propertytype;
+DROP TYPE IF EXISTS listingtype;
+DROP TYPE IF EXISTS propertystatus;
+DROP TYPE IF EXISTS propertyverificationstatus;
+COMMIT;
+
+
+-- ─── Partial index: public listings ───────────────────────────────────────────────────────
+-- ix_users_active_email was dropped from the model: no query filters on is_active, and
+-- the unique ix_users_email already serves lookups by email
+DROP INDEX IF EXISTS ix_users_active_email;
+CREATE INDEX IF NOT EXISTS ix_props_public ON properties (listing_type, city)
+    WHERE status = 'AVAILABLE' AND verification_status = 'VERIFIED';
+
+
+-- ─── users.capabilities: JSON → JSONB ──────────────────────────────────────────────────────
+-- No GIN index: capability checks run in Python, nothing queries the column with @> or ?
+ALTER TABLE users ALTER COLUMN capabilities TYPE JSONB USING capabilities::jsonb;
+DROP INDEX IF EXISTS ix_users_caps;
+
+
+-- ─── properties: default listing filter + newest-first sort ───────────────────────────────
+CREATE INDEX IF NOT EXISTS ix_props_verif_status_created
+    ON properties (verification_status, status, created_at DESC);
+
+
+-- ─── properties: weighted full-text search vector (GIN expression index) ──────────────────
+-- Must stay identical to property_search_vector() in app/models/property.py, or the
+-- planner will not match the search query to this index.
+CREATE INDEX IF NOT EXISTS ix_props_search_vector ON properties USING gin ((
+    ((setweight(to_tsvector('simple', coalesce(title, '')), 'A')
+    || setweight(to_tsvector('simple', (coalesce(address, '') || ' ') || coalesce(city, '')), 'B'))
+    || setweight(to_tsvector('simple', (((coalesce(state, '') || ' ') || coalesce(landmark, '')) || ' ') || coalesce(lga, '')), 'C'))
+    || setweight(to_tsvector('simple', coalesce(description, '')), 'D')
+));